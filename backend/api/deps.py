@@ -0,0 +1,32 @@
+"""
+Shared API dependencies
+Service singletons are created by the application lifespan in server.py
+"""
+
+from typing import Optional
+
+from fastapi import HTTPException
+
+from services.auction_service import AuctionService
+from services.price_service import PriceService
+from services.operator_service import OperatorService
+
+# Global services
+auction_service: Optional[AuctionService] = None
+price_service: Optional[PriceService] = None
+operator_service: Optional[OperatorService] = None
+
+async def get_auction_service() -> AuctionService:
+    if not auction_service:
+        raise HTTPException(status_code=503, detail="Auction service not available")
+    return auction_service
+
+async def get_price_service() -> PriceService:
+    if not price_service:
+        raise HTTPException(status_code=503, detail="Price service not available")
+    return price_service
+
+async def get_operator_service() -> OperatorService:
+    if not operator_service:
+        raise HTTPException(status_code=503, detail="Operator service not available")
+    return operator_service
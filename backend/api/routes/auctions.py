@@ -2,18 +2,119 @@
 Auction API routes
 """
 
-from typing import List, Optional
+import asyncio
+import hashlib
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+import ciso8601
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from prometheus_client import Gauge
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+import structlog
 
+from api.deps import get_auction_service
 from services.auction_service import AuctionService
 from models.auction import Auction, AuctionStatus, Bid
 
+logger = structlog.get_logger()
+
 router = APIRouter()
 
+# Shared error responses. Raised via with_traceback(None) so repeated raises
+# don't chain tracebacks onto the same instance.
+_AUCTION_NOT_FOUND = HTTPException(status_code=404, detail="Auction not found")
+_REVEAL_FAILED = HTTPException(status_code=400, detail="Failed to reveal bid")
+_COMPLETE_FAILED = HTTPException(status_code=400, detail="Failed to complete auction")
+
+# Cache namespace shared by the read-only auction list endpoints. Entries are
+# invalidated by bumping a generation counter that is part of every key,
+# instead of deleting keys by pattern.
+_CACHE_NAMESPACE = "auctions_list"
+_CACHE_GENERATION_KEY = f"{_CACHE_NAMESPACE}:generation"
+
+def _cache_generation_key() -> str:
+    return f"{FastAPICache.get_prefix()}:{_CACHE_GENERATION_KEY}"
+
+async def _query_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request=None,
+    response=None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """Build a cache key from the query parameters only, ignoring injected services"""
+    try:
+        generation = await FastAPICache.get_backend().get(_cache_generation_key())
+    except Exception:
+        logger.warning("Failed to read auction cache generation", exc_info=True)
+        generation = None
+    params = sorted(
+        (name, value) for name, value in kwargs.items()
+        if not isinstance(value, AuctionService)
+    )
+    digest = hashlib.md5(f"{func.__name__}:{generation}:{params}".encode()).hexdigest()
+    return f"{namespace}:{digest}"
+
+async def _invalidate_auction_cache():
+    """Retire cached auction lists after a state change
+
+    Failures are only logged: the state change has already happened, and
+    stale entries expire within a few seconds anyway.
+    """
+    try:
+        await FastAPICache.get_backend().redis.incr(_cache_generation_key())
+    except Exception:
+        logger.warning("Failed to invalidate auction cache", exc_info=True)
+
+# Auction statistics are recomputed at most once per TTL window
+STATS_TTL_SECONDS = 10.0
+_stats_cache: Dict[str, Any] = {"ts": 0.0, "value": None}
+_stats_lock = asyncio.Lock()
+
+AUCTION_TOTAL = Gauge('auctions_total', 'Total number of auctions')
+AUCTION_MEV_RECOVERED = Gauge('auctions_mev_recovered', 'Total MEV recovered through auctions')
+
+def _cached_stats() -> Optional[Dict[str, Any]]:
+    if time.monotonic() - _stats_cache["ts"] < STATS_TTL_SECONDS:
+        return _stats_cache["value"]
+    return None
+
+async def _refresh_stats(auction_service: AuctionService) -> Dict[str, Any]:
+    """Return cached stats, letting a single caller recompute them when stale"""
+    async with _stats_lock:
+        # Another request may have refreshed the cache while we waited
+        stats = _cached_stats()
+        if stats is None:
+            stats = await auction_service.get_auction_stats()
+            _stats_cache.update(ts=time.monotonic(), value=stats)
+            AUCTION_TOTAL.set(stats.get("total_auctions", 0))
+            AUCTION_MEV_RECOVERED.set(stats.get("total_mev_recovered", 0))
+        return stats
+
+async def publish_stats_periodically(auction_service: AuctionService):
+    """Keep the stats cache and gauges fresh for Prometheus scrapes"""
+    while True:
+        try:
+            await _refresh_stats(auction_service)
+        except Exception:
+            logger.warning("Failed to refresh auction stats", exc_info=True)
+        await asyncio.sleep(STATS_TTL_SECONDS)
+
+def _parse_datetime(value: Any) -> Any:
+    """Parse ISO 8601 strings with the C parser before pydantic sees them"""
+    if isinstance(value, str):
+        return ciso8601.parse_datetime(value)
+    return value
+
 class AuctionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     pool_id: str
     start_time: datetime
@@ -25,6 +126,11 @@ class AuctionResponse(BaseModel):
     mev_recovered: Optional[float] = None
     block_number: int
 
+    @field_validator('start_time', mode='before')
+    @classmethod
+    def parse_start_time(cls, value: Any) -> Any:
+        return _parse_datetime(value)
+
 class AuctionCreateRequest(BaseModel):
     pool_id: str
     duration: int = Field(default=12, ge=1, le=60)
@@ -37,6 +143,8 @@ class BidRequest(BaseModel):
     commitment: str
 
 class BidResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     bid_id: str
     auction_id: str
     bidder: str
@@ -44,94 +152,140 @@ class BidResponse(BaseModel):
     timestamp: datetime
     revealed: bool
 
-@router.get("/", response_model=List[AuctionResponse])
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def parse_timestamp(cls, value: Any) -> Any:
+        return _parse_datetime(value)
+
+# Validate whole result lists in a single pydantic-core call
+_AUCTION_LIST_ADAPTER = TypeAdapter(List[AuctionResponse])
+_BID_LIST_ADAPTER = TypeAdapter(List[BidResponse])
+
+def _serialize_auctions(auctions) -> List[AuctionResponse]:
+    return _AUCTION_LIST_ADAPTER.validate_python(auctions, from_attributes=True)
+
+def _json_response(body: Any, **kwargs) -> Response:
+    """Wrap an already rendered JSON body, bypassing response_model"""
+    return Response(body, media_type="application/json", **kwargs)
+
+def _body_etag(body: bytes) -> str:
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    # Weak, since GZipMiddleware sends the same tag for gzip and identity bodies
+    return f'W/"{digest}"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+# The page is cached as its rendered body together with the ETag derived
+# from it, so cache hits, 304s and HEADs need no database query
+@cache(expire=2, namespace=_CACHE_NAMESPACE, key_builder=_query_key_builder)
+async def _fetch_auctions(
+    auction_service: AuctionService,
+    *,
+    status: Optional[AuctionStatus],
+    limit: int,
+    offset: int
+) -> Dict[str, str]:
+    auctions = await auction_service.get_auctions(
+        status=status,
+        limit=limit,
+        offset=offset
+    )
+    body = _AUCTION_LIST_ADAPTER.dump_json(_serialize_auctions(auctions))
+    return {"etag": _body_etag(body), "body": body.decode()}
+
+# Rows are validated once and returned as a pre-rendered body, which skips
+# FastAPI's response_model pass; the model only documents them
+@router.get("/", response_model=None, responses={200: {"model": List[AuctionResponse]}})
+@router.head("/", include_in_schema=False)
 async def get_auctions(
+    request: Request,
     status: Optional[AuctionStatus] = Query(None, description="Filter by auction status"),
     limit: int = Query(50, ge=1, le=100, description="Number of auctions to return"),
     offset: int = Query(0, ge=0, description="Number of auctions to skip"),
-    auction_service: AuctionService = Depends()
+    auction_service: AuctionService = Depends(get_auction_service)
 ):
     """Get list of auctions with optional filtering"""
-    try:
-        auctions = await auction_service.get_auctions(
-            status=status,
-            limit=limit,
-            offset=offset
-        )
-        return [AuctionResponse.from_orm(auction) for auction in auctions]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch auctions: {str(e)}")
-
-@router.get("/active", response_model=List[AuctionResponse])
-async def get_active_auctions(auction_service: AuctionService = Depends()):
+    page = await _fetch_auctions(
+        auction_service,
+        status=status,
+        limit=limit,
+        offset=offset
+    )
+    etag = page["etag"]
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    if request.method == "HEAD":
+        return _json_response(None, headers={"ETag": etag})
+    return _json_response(page["body"], headers={"ETag": etag})
+
+@cache(expire=1, namespace=_CACHE_NAMESPACE, key_builder=_query_key_builder)
+async def _fetch_active_auctions(auction_service: AuctionService) -> str:
+    auctions = await auction_service.get_active_auctions()
+    return _AUCTION_LIST_ADAPTER.dump_json(_serialize_auctions(auctions)).decode()
+
+@router.get("/active", response_model=None, responses={200: {"model": List[AuctionResponse]}})
+async def get_active_auctions(auction_service: AuctionService = Depends(get_auction_service)):
     """Get all currently active auctions"""
-    try:
-        auctions = await auction_service.get_active_auctions()
-        return [AuctionResponse.from_orm(auction) for auction in auctions]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch active auctions: {str(e)}")
+    return _json_response(await _fetch_active_auctions(auction_service))
 
 @router.get("/{auction_id}", response_model=AuctionResponse)
 async def get_auction(
     auction_id: str,
-    auction_service: AuctionService = Depends()
+    auction_service: AuctionService = Depends(get_auction_service)
 ):
     """Get specific auction by ID"""
-    try:
-        auction = await auction_service.get_auction_by_id(auction_id)
-        if not auction:
-            raise HTTPException(status_code=404, detail="Auction not found")
-        return AuctionResponse.from_orm(auction)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch auction: {str(e)}")
+    auction = await auction_service.get_auction_by_id(auction_id)
+    if not auction:
+        raise _AUCTION_NOT_FOUND.with_traceback(None)
+    return AuctionResponse.model_validate(auction)
 
 @router.post("/", response_model=AuctionResponse)
 async def create_auction(
     request: AuctionCreateRequest,
-    auction_service: AuctionService = Depends()
+    auction_service: AuctionService = Depends(get_auction_service)
 ):
     """Create a new auction"""
-    try:
-        auction = await auction_service.create_auction(
-            pool_id=request.pool_id,
-            duration=request.duration,
-            min_bid=request.min_bid
-        )
-        return AuctionResponse.from_orm(auction)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to create auction: {str(e)}")
+    auction = await auction_service.create_auction(
+        pool_id=request.pool_id,
+        duration=request.duration,
+        min_bid=request.min_bid
+    )
+    await _invalidate_auction_cache()
+    return AuctionResponse.model_validate(auction)
 
 @router.post("/{auction_id}/bids", response_model=BidResponse)
 async def submit_bid(
     auction_id: str,
     request: BidRequest,
-    auction_service: AuctionService = Depends()
+    auction_service: AuctionService = Depends(get_auction_service)
 ):
     """Submit a sealed bid to an auction"""
-    try:
-        bid = await auction_service.submit_bid(
-            auction_id=auction_id,
-            bidder=request.bidder,
-            amount=request.amount,
-            commitment=request.commitment
-        )
-        return BidResponse.from_orm(bid)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to submit bid: {str(e)}")
-
-@router.get("/{auction_id}/bids", response_model=List[BidResponse])
+    bid = await auction_service.submit_bid(
+        auction_id=auction_id,
+        bidder=request.bidder,
+        amount=request.amount,
+        commitment=request.commitment
+    )
+    await _invalidate_auction_cache()
+    return BidResponse.model_validate(bid)
+
+@router.get("/{auction_id}/bids", response_model=None, responses={200: {"model": List[BidResponse]}})
 async def get_auction_bids(
     auction_id: str,
-    auction_service: AuctionService = Depends()
+    auction_service: AuctionService = Depends(get_auction_service)
 ):
     """Get all bids for an auction"""
-    try:
-        bids = await auction_service.get_auction_bids(auction_id)
-        return [BidResponse.from_orm(bid) for bid in bids]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch bids: {str(e)}")
+    bids = await auction_service.get_auction_bids(auction_id)
+    return _json_response(
+        _BID_LIST_ADAPTER.dump_json(_BID_LIST_ADAPTER.validate_python(bids, from_attributes=True))
+    )
 
 @router.post("/{auction_id}/reveal")
 async def reveal_bid(
@@ -139,64 +293,55 @@ async def reveal_bid(
     bidder: str = Query(..., description="Bidder address"),
     amount: float = Query(..., description="Bid amount"),
     nonce: str = Query(..., description="Bid nonce"),
-    auction_service: AuctionService = Depends()
+    auction_service: AuctionService = Depends(get_auction_service)
 ):
     """Reveal a sealed bid"""
-    try:
-        success = await auction_service.reveal_bid(
-            auction_id=auction_id,
-            bidder=bidder,
-            amount=amount,
-            nonce=nonce
-        )
-        if not success:
-            raise HTTPException(status_code=400, detail="Failed to reveal bid")
-        return {"message": "Bid revealed successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to reveal bid: {str(e)}")
+    success = await auction_service.reveal_bid(
+        auction_id=auction_id,
+        bidder=bidder,
+        amount=amount,
+        nonce=nonce
+    )
+    if not success:
+        raise _REVEAL_FAILED.with_traceback(None)
+    return {"message": "Bid revealed successfully"}
 
 @router.post("/{auction_id}/complete")
 async def complete_auction(
     auction_id: str,
     winner: str = Query(..., description="Winner address"),
     winning_bid: float = Query(..., description="Winning bid amount"),
-    auction_service: AuctionService = Depends()
+    auction_service: AuctionService = Depends(get_auction_service)
 ):
     """Complete an auction with the winner"""
-    try:
-        success = await auction_service.complete_auction(
-            auction_id=auction_id,
-            winner=winner,
-            winning_bid=winning_bid
-        )
-        if not success:
-            raise HTTPException(status_code=400, detail="Failed to complete auction")
-        return {"message": "Auction completed successfully"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to complete auction: {str(e)}")
+    success = await auction_service.complete_auction(
+        auction_id=auction_id,
+        winner=winner,
+        winning_bid=winning_bid
+    )
+    if not success:
+        raise _COMPLETE_FAILED.with_traceback(None)
+    await _invalidate_auction_cache()
+    return {"message": "Auction completed successfully"}
 
 @router.get("/stats/summary")
-async def get_auction_stats(auction_service: AuctionService = Depends()):
+async def get_auction_stats(auction_service: AuctionService = Depends(get_auction_service)):
     """Get auction statistics summary"""
-    try:
-        stats = await auction_service.get_auction_stats()
-        return stats
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch auction stats: {str(e)}")
+    stats = _cached_stats()
+    if stats is None:
+        stats = await _refresh_stats(auction_service)
+    return stats
 
-@router.get("/pool/{pool_id}", response_model=List[AuctionResponse])
+@cache(expire=5, namespace=_CACHE_NAMESPACE, key_builder=_query_key_builder)
+async def _fetch_pool_auctions(auction_service: AuctionService, *, pool_id: str, limit: int) -> str:
+    auctions = await auction_service.get_pool_auctions(pool_id, limit)
+    return _AUCTION_LIST_ADAPTER.dump_json(_serialize_auctions(auctions)).decode()
+
+@router.get("/pool/{pool_id}", response_model=None, responses={200: {"model": List[AuctionResponse]}})
 async def get_pool_auctions(
     pool_id: str,
     limit: int = Query(20, ge=1, le=100),
-    auction_service: AuctionService = Depends()
+    auction_service: AuctionService = Depends(get_auction_service)
 ):
     """Get auctions for a specific pool"""
-    try:
-        auctions = await auction_service.get_pool_auctions(pool_id, limit)
-        return [AuctionResponse.from_orm(auction) for auction in auctions]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch pool auctions: {str(e)}")
+    return _json_response(await _fetch_pool_auctions(auction_service, pool_id=pool_id, limit=limit))
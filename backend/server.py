@@ -5,19 +5,29 @@ FastAPI-based backend for auction monitoring and data aggregation
 
 import asyncio
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
 import structlog
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
 
+from api import deps
 from api.routes import auctions, operators, price_feeds, metrics
 from services.auction_service import AuctionService
 from services.price_service import PriceService
 from services.operator_service import OperatorService
+from utils.cache import ORJsonCoder
+from utils.monitor import MonitorThread
 from utils.websocket_manager import WebSocketManager
 from models.database import init_db
 
@@ -46,32 +56,47 @@ logger = structlog.get_logger()
 REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
 REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration', ['method', 'endpoint'])
 
-# Global services
-auction_service: Optional[AuctionService] = None
-price_service: Optional[PriceService] = None
-operator_service: Optional[OperatorService] = None
 websocket_manager: Optional[WebSocketManager] = None
 
+# Seconds to wait for each monitor thread to exit after its service stops
+MONITOR_SHUTDOWN_TIMEOUT = 10.0
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    global auction_service, price_service, operator_service, websocket_manager
+    global websocket_manager
     
     logger.info("Starting LVR Auction Hook Backend API")
     
     # Initialize database
     await init_db()
     
+    # Initialize response cache
+    redis = aioredis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+    FastAPICache.init(RedisBackend(redis), prefix="lvr-cache", coder=ORJsonCoder)
+    
     # Initialize services
-    auction_service = AuctionService()
-    price_service = PriceService()
-    operator_service = OperatorService()
+    deps.auction_service = AuctionService()
+    deps.price_service = PriceService()
+    deps.operator_service = OperatorService()
     websocket_manager = WebSocketManager()
     
-    # Start background tasks
-    asyncio.create_task(price_service.start_monitoring())
-    asyncio.create_task(auction_service.start_monitoring())
-    asyncio.create_task(operator_service.start_monitoring())
+    # Start background monitors, each on its own event loop in a daemon
+    # thread so CPU-heavy decoding cannot starve the API loop. The monitors
+    # drive the shared service instances, so routes and /health see their state.
+    monitors = [
+        MonitorThread("price", deps.price_service),
+        MonitorThread("auction", deps.auction_service),
+        MonitorThread("operator", deps.operator_service),
+    ]
+    for monitor in monitors:
+        monitor.start()
+    
+    # Publish auction stats gauges whether or not /stats/summary is polled
+    stats_task = asyncio.create_task(auctions.publish_stats_periodically(deps.auction_service))
+    
+    # Build the OpenAPI schema now so the first request does not pay for it
+    app.openapi()
     
     logger.info("All services started successfully")
     
@@ -79,9 +104,10 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("Shutting down services...")
-    await price_service.stop()
-    await auction_service.stop()
-    await operator_service.stop()
+    stats_task.cancel()
+    # Each monitor stops its own service on the loop it was started on
+    await asyncio.gather(*(monitor.stop(MONITOR_SHUTDOWN_TIMEOUT) for monitor in monitors))
+    await redis.close()
     logger.info("Shutdown complete")
 
 # Create FastAPI app
@@ -89,9 +115,44 @@ app = FastAPI(
     title="LVR Auction Hook API",
     description="Backend API for LVR Auction Hook - MEV redistribution through EigenLayer AVS",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+class CatchAllExceptionsMiddleware:
+    """Translate unhandled route errors into 500 responses"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            logger.error("Unhandled exception", error=str(exc), exc_info=True)
+            if response_started:
+                raise
+            response = ORJSONResponse(
+                status_code=500,
+                content={"error": str(exc), "status_code": 500}
+            )
+            await response(scope, receive, send)
+
+# Registered before CORS so error responses still carry CORS headers
+app.add_middleware(CatchAllExceptionsMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -101,6 +162,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads such as auction and bid lists
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(auctions.router, prefix="/api/v1/auctions", tags=["auctions"])
 app.include_router(operators.router, prefix="/api/v1/operators", tags=["operators"])
@@ -121,11 +185,11 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": "2024-01-01T00:00:00Z",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "services": {
-            "auction_service": auction_service.is_healthy() if auction_service else False,
-            "price_service": price_service.is_healthy() if price_service else False,
-            "operator_service": operator_service.is_healthy() if operator_service else False,
+            "auction_service": deps.auction_service.is_healthy() if deps.auction_service else False,
+            "price_service": deps.price_service.is_healthy() if deps.price_service else False,
+            "operator_service": deps.operator_service.is_healthy() if deps.operator_service else False,
         }
     }
 
@@ -136,55 +200,52 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             # Keep connection alive and handle incoming messages
-            data = await websocket.receive_text()
-            await websocket_manager.handle_message(websocket, data)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            data = websocket_manager.decode_message(websocket, message)
+            if data is not None:
+                await websocket_manager.handle_message(websocket, data)
     except WebSocketDisconnect:
-        websocket_manager.disconnect(websocket)
+        await websocket_manager.disconnect(websocket)
+
+# Rendered metrics are reused briefly so rapid scrapes don't re-format them
+METRICS_CACHE_SECONDS = 1.0
+_metrics_cache: Tuple[float, bytes] = (float("-inf"), b"")
 
 @app.get("/metrics")
 async def prometheus_metrics():
     """Prometheus metrics endpoint"""
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
-
-# Dependency injection
-async def get_auction_service() -> AuctionService:
-    if not auction_service:
-        raise HTTPException(status_code=503, detail="Auction service not available")
-    return auction_service
-
-async def get_price_service() -> PriceService:
-    if not price_service:
-        raise HTTPException(status_code=503, detail="Price service not available")
-    return price_service
-
-async def get_operator_service() -> OperatorService:
-    if not operator_service:
-        raise HTTPException(status_code=503, detail="Operator service not available")
-    return operator_service
+    global _metrics_cache
+    ts, body = _metrics_cache
+    now = time.monotonic()
+    if now - ts >= METRICS_CACHE_SECONDS:
+        body = await asyncio.to_thread(generate_latest)
+        _metrics_cache = (now, body)
+    return Response(body, media_type=CONTENT_TYPE_LATEST)
 
 # Error handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     logger.error("HTTP exception", status_code=exc.status_code, detail=exc.detail)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail, "status_code": exc.status_code}
     )
 
-@app.exception_handler(Exception)
-async def general_exception_handler(request, exc):
-    logger.error("Unhandled exception", error=str(exc), exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={"error": "Internal server error", "status_code": 500}
-    )
 
 if __name__ == "__main__":
     import uvicorn
+    # Every worker runs the full lifespan (monitors, WebSocket manager, stats
+    # cache, Prometheus registry), so only raise WEB_CONCURRENCY once that
+    # state is shared across processes
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=8001,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+        reload=False,
         log_level="info"
     )
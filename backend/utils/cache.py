@@ -0,0 +1,25 @@
+"""
+Response cache helpers
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi_cache.coder import Coder
+
+class ORJsonCoder(Coder):
+    """Cache coder that stores values as orjson bytes
+
+    Cached values decode to the same plain JSON types the API emits, so a
+    cache hit renders exactly like the response that populated it. UTC
+    datetimes keep pydantic's Z suffix.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return orjson.dumps(value, default=jsonable_encoder, option=orjson.OPT_UTC_Z)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        return orjson.loads(value)
@@ -0,0 +1,64 @@
+"""
+Background monitor threads
+Runs each service monitor on a private event loop so it cannot starve the API loop
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+class MonitorThread(threading.Thread):
+    """Daemon thread running one service's monitor on its own event loop
+
+    The thread drives the same service instance the API uses, so state the
+    monitor keeps (prices, active auctions, the health flag) is what routes
+    and /health read. start_monitoring() and stop() run on the monitor loop;
+    loop-bound resources the monitor needs (DB pools, HTTP sessions) must be
+    opened inside start_monitoring() rather than shared with request
+    handlers. As a daemon thread, a monitor that ignores stop() cannot keep
+    the process alive at exit.
+    """
+
+    def __init__(self, name: str, service: Any):
+        super().__init__(name=f"mon-{name}", daemon=True)
+        self.service = service
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def run(self):
+        asyncio.run(self._main())
+
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        try:
+            await self.service.start_monitoring()
+        except asyncio.CancelledError:
+            logger.warning("Monitor cancelled", monitor=self.name)
+        except Exception:
+            logger.error("Monitor crashed", monitor=self.name, exc_info=True)
+        else:
+            logger.info("Monitor stopped", monitor=self.name)
+
+    async def stop(self, timeout: float):
+        """Stop the monitor, waiting at most `timeout` seconds for its thread"""
+        deadline = time.monotonic() + timeout
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                future = asyncio.run_coroutine_threadsafe(self.service.stop(), loop)
+                await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except Exception:
+                logger.warning("Monitor stop failed", monitor=self.name, exc_info=True)
+        await asyncio.to_thread(self.join, max(0.0, deadline - time.monotonic()))
+        if self.is_alive():
+            logger.warning("Monitor did not stop in time, cancelling it", monitor=self.name)
+            try:
+                loop.call_soon_threadsafe(self._task.cancel)
+            except (AttributeError, RuntimeError):
+                pass
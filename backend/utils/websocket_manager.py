@@ -0,0 +1,127 @@
+"""
+WebSocket connection manager
+Tracks dashboard connections and fans out real-time updates
+"""
+
+import asyncio
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+import ormsgpack
+import structlog
+from fastapi import WebSocket
+
+logger = structlog.get_logger()
+
+# Connections are spread over shards so connect/disconnect only contend per shard
+NUM_SHARDS = 16
+
+# Each shard maps a connection to its framing: True once the client has sent
+# a binary (msgpack) frame, False for text (JSON) clients
+Shard = Tuple[asyncio.Lock, Dict[WebSocket, bool]]
+
+class WebSocketManager:
+    """Manages active WebSocket connections"""
+
+    def __init__(self, num_shards: int = NUM_SHARDS):
+        self.shards: List[Shard] = [(asyncio.Lock(), {}) for _ in range(num_shards)]
+        # Shards are handed out round-robin; id()/hash() of a WebSocket are
+        # address-derived and cluster on a few shards
+        self._next_shard = itertools.count()
+        self._shard_index: Dict[WebSocket, int] = {}
+
+    def _shard(self, websocket: WebSocket) -> Optional[Shard]:
+        index = self._shard_index.get(websocket)
+        return None if index is None else self.shards[index]
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(connections) for _, connections in self.shards)
+
+    async def connect(self, websocket: WebSocket):
+        """Accept and register a new connection
+
+        Connections start out as text (JSON) clients and switch to msgpack
+        after their first binary frame.
+        """
+        await websocket.accept()
+        index = next(self._next_shard) % len(self.shards)
+        self._shard_index[websocket] = index
+        lock, connections = self.shards[index]
+        async with lock:
+            connections[websocket] = False
+        logger.info("WebSocket connected", connections=self.connection_count)
+
+    async def disconnect(self, websocket: WebSocket):
+        """Forget a closed connection"""
+        index = self._shard_index.pop(websocket, None)
+        if index is not None:
+            lock, connections = self.shards[index]
+            async with lock:
+                connections.pop(websocket, None)
+        logger.info("WebSocket disconnected", connections=self.connection_count)
+
+    def decode_message(self, websocket: WebSocket, message: Dict[str, Any]) -> Optional[Any]:
+        """Decode an inbound frame and remember the client's framing
+
+        Binary frames carry msgpack, text frames carry JSON.
+        """
+        binary = message.get("bytes") is not None
+        shard = self._shard(websocket)
+        if shard is not None and websocket in shard[1]:
+            shard[1][websocket] = binary
+        try:
+            if binary:
+                return ormsgpack.unpackb(message["bytes"])
+            return orjson.loads(message["text"])
+        except (ormsgpack.MsgpackDecodeError, orjson.JSONDecodeError):
+            logger.warning("Invalid WebSocket message")
+            return None
+
+    async def handle_message(self, websocket: WebSocket, message: Any):
+        """Handle a decoded client message"""
+        if isinstance(message, dict) and message.get("type") == "ping":
+            await self.send(websocket, {"type": "pong"})
+
+    async def send(self, websocket: WebSocket, message: Dict[str, Any]):
+        """Send a message to one client in its own framing"""
+        shard = self._shard(websocket)
+        if shard is not None and shard[1].get(websocket):
+            await websocket.send_bytes(ormsgpack.packb(message))
+        else:
+            await websocket.send_text(orjson.dumps(message).decode())
+
+    async def broadcast(self, message: Dict[str, Any]):
+        """Send a message to every connected client"""
+        # Serialize once per framing and write to all shards concurrently
+        binary_payload = ormsgpack.packb(message)
+        text_payload = orjson.dumps(message).decode()
+        await asyncio.gather(*(
+            self._send_shard(shard, binary_payload, text_payload)
+            for shard in self.shards if shard[1]
+        ))
+
+    async def _send_shard(self, shard: Shard, binary_payload: bytes, text_payload: str):
+        lock, connections = shard
+        async with lock:
+            targets = list(connections.items())
+        if not targets:
+            return
+        results = await asyncio.gather(
+            *(
+                websocket.send_bytes(binary_payload) if binary else websocket.send_text(text_payload)
+                for websocket, binary in targets
+            ),
+            return_exceptions=True
+        )
+        failed = [
+            websocket for (websocket, _), result in zip(targets, results)
+            if isinstance(result, Exception)
+        ]
+        if failed:
+            logger.warning("WebSocket send failed", connections=len(failed))
+            async with lock:
+                for websocket in failed:
+                    connections.pop(websocket, None)
+                    self._shard_index.pop(websocket, None)